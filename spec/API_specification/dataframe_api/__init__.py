@@ -86,6 +86,14 @@ def concat(dataframes: Sequence[DataFrame]) -> DataFrame:
     The order in which the input DataFrames appear in
     the output is preserved (so long as the DataFrame implementation supports row
     ordering).
+
+    The result need not be stored contiguously. Implementations may represent
+    it as a list of chunks referencing the data of the input DataFrames, so that
+    the cost of `concat` depends on the number of DataFrames rather than on the
+    number of rows. Such a result may then be exposed as multiple chunks via the
+    interchange protocol, i.e. by ``df.dataframe.__dataframe__().get_chunks()``
+    (where ``df`` is the result of `concat`). Implementations may compact chunks
+    into contiguous storage when :meth:`DataFrame.persist` is called.
     """
     ...
 
@@ -102,8 +110,8 @@ def column_from_sequence(
     ----------
     sequence : Sequence[object]
         Sequence of elements. Each element must be of the specified
-        ``dtype``, the corresponding Python builtin scalar type, or
-        coercible to that Python scalar type.
+        ``dtype``, the corresponding Python builtin scalar type,
+        coercible to that Python scalar type, or `null`.
     name : str, optional
         Name of column.
     dtype : DType
@@ -112,6 +120,23 @@ def column_from_sequence(
     Returns
     -------
     Column
+
+    Notes
+    -----
+    Because `dtype` is given, implementations do not need to infer a type from
+    the elements, and may convert `sequence` in a single pass directly into the
+    storage for that dtype (and its validity mask, if any), without going through
+    an intermediate representation of generic Python objects.
+
+    Examples
+    --------
+    >>> df: DataFrame
+    >>> pdx = df.__dataframe_namespace__()
+    >>> column = pdx.column_from_sequence(
+    ...     [1, 2, pdx.null],
+    ...     dtype=pdx.Int64(),
+    ...     name='a',
+    ... )
     """
     ...
 
@@ -165,6 +190,13 @@ def column_from_1d_array(array: Any, *, name: str = "") -> Column:
     Returns
     -------
     Column
+
+    Notes
+    -----
+    Where possible, implementations should wrap `array` without copying it
+    (e.g. by consuming it via ``__dlpack__``). The resulting column may then
+    share memory with `array`, so modifying `array` in-place afterwards results
+    in undefined behaviour.
     """
     ...
 
@@ -201,6 +233,13 @@ def dataframe_from_2d_array(array: Any, *, names: Sequence[str]) -> DataFrame:
     Returns
     -------
     DataFrame
+
+    Notes
+    -----
+    As for `column_from_1d_array`, implementations should avoid copying `array`
+    where possible: each column of the result may be a (strided) view of the
+    corresponding column of `array`, so modifying `array` in-place afterwards
+    results in undefined behaviour.
     """
     ...
 
@@ -312,11 +351,27 @@ def any_horizontal(*columns: Column, skip_nulls: bool = True) -> Column:
     All the `columns` must have the same parent DataFrame.
     The return value has the same parent DataFrame as the input columns.
 
+    Parameters
+    ----------
+    *columns : Column
+        Boolean columns to reduce.
+    skip_nulls : bool
+        If ``True``, null values are ignored (and a row in which all values are
+        null results in ``False``).
+        If ``False``, nulls follow Kleene Logic: each row is ``True`` if any value
+        is ``True``, else `null` if any value is `null`, else ``False``.
+
     Raises
     ------
     ValueError
         If any of the columns is not boolean.
 
+    Notes
+    -----
+    Implementations should reduce all `columns` in a single pass (e.g. over
+    packed bitmasks, where available), rather than materialising intermediate
+    results of ``columns[0] | columns[1] ...``.
+
     Examples
     --------
     >>> df: DataFrame
@@ -338,11 +393,27 @@ def all_horizontal(*columns: Column, skip_nulls: bool = True) -> Column:
     All the `columns` must have the same parent DataFrame.
     The return value has the same parent DataFrame as the input columns.
 
+    Parameters
+    ----------
+    *columns : Column
+        Boolean columns to reduce.
+    skip_nulls : bool
+        If ``True``, null values are ignored (and a row in which all values are
+        null results in ``True``).
+        If ``False``, nulls follow Kleene Logic: each row is ``False`` if any value
+        is ``False``, else `null` if any value is `null`, else ``True``.
+
     Raises
     ------
     ValueError
         If any of the columns is not boolean.
 
+    Notes
+    -----
+    Implementations should reduce all `columns` in a single pass (e.g. over
+    packed bitmasks, where available), rather than materialising intermediate
+    results of ``columns[0] & columns[1] ...``.
+
     Examples
     --------
     >>> df: DataFrame
@@ -389,6 +460,10 @@ def sorted_indices(
     ------
     ValueError
         If `keys` and `ascending` are sequences of different lengths.
+
+    Notes
+    -----
+    The sorting algorithm is implementation defined - see :meth:`DataFrame.sort`.
     """
     ...
 
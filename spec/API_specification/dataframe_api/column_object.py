@@ -133,6 +133,13 @@ class Column(Protocol):
         Returns
         -------
         Column
+
+        Notes
+        -----
+        If `step` is ``None`` or positive, the selected rows keep their relative
+        order, so sortedness of `self` carries over to the result. If `step` is
+        negative, their order is reversed, and so is the direction of any sort
+        order (e.g. an ascending `self` gives a descending result).
         """
         ...
 
@@ -151,6 +158,9 @@ class Column(Protocol):
         -----
         Some participants preferred a weaker type Arraylike[bool] for mask,
         where 'Arraylike' denotes an object adhering to the Array API standard.
+
+        The selected rows keep their relative order, so if `self` is sorted,
+        then so is the result.
         """
         ...
 
@@ -167,6 +177,17 @@ class Column(Protocol):
         Scalar
             Depends on the dtype of the Column, and may vary
             across implementations.
+
+        Notes
+        -----
+        `row_number` refers to the position in the whole column, regardless of
+        how the column is stored. If it is stored in chunks (e.g. as a result of
+        :func:`concat`), implementations should locate the relevant chunk with a
+        binary search over the chunks' cumulative lengths, rather than by visiting
+        chunks one after the other.
+
+        To look up many values at once, use :meth:`take` with a column of row
+        numbers, rather than calling `get_value` repeatedly.
         """
         ...
 
@@ -222,6 +243,11 @@ class Column(Protocol):
         Returns
         -------
         Column
+
+        Notes
+        -----
+        The sorting algorithm is implementation defined - see
+        :meth:`DataFrame.sort`.
         """
         ...
 
@@ -410,6 +436,8 @@ class Column(Protocol):
     def __add__(self, other: Self | AnyScalar) -> Self:
         """Add `other` column or scalar to this column.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Self or Scalar
@@ -431,6 +459,8 @@ class Column(Protocol):
     def __sub__(self, other: Self | AnyScalar) -> Self:
         """Subtract `other` column or scalar from this column.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Self or Scalar
@@ -452,6 +482,8 @@ class Column(Protocol):
     def __mul__(self, other: Self | AnyScalar) -> Self:
         """Multiply `other` column or scalar with this column.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Self or Scalar
@@ -473,6 +505,8 @@ class Column(Protocol):
     def __truediv__(self, other: Self | AnyScalar) -> Self:
         """Divide this column by `other` column or scalar. True division, returns floats.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Self or Scalar
@@ -494,6 +528,8 @@ class Column(Protocol):
     def __floordiv__(self, other: Self | AnyScalar) -> Self:
         """Floor-divide `other` column or scalar to this column.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Self or Scalar
@@ -515,6 +551,8 @@ class Column(Protocol):
     def __pow__(self, other: Self | AnyScalar) -> Self:
         """Raise this column to the power of `other`.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Integer dtype to the power of non-negative integer dtype is integer dtype.
         Integer dtype to the power of float dtype is float dtype.
         Float dtype to the power of integer dtype or float dtype is float dtype.
@@ -540,6 +578,8 @@ class Column(Protocol):
     def __mod__(self, other: Self | AnyScalar) -> Self:
         """Return modulus of this column by `other` (`%` operator).
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Self or Scalar
@@ -561,6 +601,8 @@ class Column(Protocol):
     def __divmod__(self, other: Self | AnyScalar) -> tuple[Column, Column]:
         """Return quotient and remainder of integer division. See `divmod` builtin.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Self or Scalar
@@ -667,6 +709,15 @@ class Column(Protocol):
         datetime data types. Returns a float for numerical data types, and
         datetime (with the appropriate timedelta format string) for datetime
         dtypes.
+
+        Notes
+        -----
+        The result must be exact. If the number of (non-null) values is even,
+        the median is the mean of the two middle values.
+        Computing it does not require sorting the column - selection
+        algorithms (such as introselect) are sufficient.
+        Approximate medians (e.g. based on quantile sketches) are outside the
+        scope of the Standard.
         """
         ...
 
@@ -710,6 +761,15 @@ class Column(Protocol):
             correction). Fractional (float) values are allowed. Default: ``1``.
         skip_nulls
             Whether to skip null values.
+
+        Notes
+        -----
+        Implementations should use a numerically stable algorithm, so that
+        precision is not lost for data with a large mean relative to its
+        spread. For example, per-chunk counts, means and sums of squared
+        deviations may be computed in a single pass and then combined
+        (as in Welford's and Chan et al.'s algorithms). The naive one-pass
+        formula, "mean of squares minus square of the mean", is not suitable.
         """
         ...
 
@@ -729,11 +789,15 @@ class Column(Protocol):
         Parameters
         ----------
         correction
-            Correction to apply to the result. For example, ``0`` for sample
-            standard deviation and ``1`` for population standard deviation.
+            Correction to apply to the result. For example, ``0`` for population
+            variance and ``1`` for sample variance.
             See `Column.std` for a more detailed description.
         skip_nulls
             Whether to skip null values.
+
+        Notes
+        -----
+        As for `Column.std`, a numerically stable algorithm should be used.
         """
         ...
 
@@ -749,6 +813,10 @@ class Column(Protocol):
         If the original column(s) contain multiple `'NaN'` values, then
         they only count as one distinct value.
         Likewise for null values (if ``skip_nulls=False``).
+
+        The result must be exact. Approximate distinct counts (e.g. based on
+        HyperLogLog sketches) are outside the scope of the Standard, though
+        libraries may expose them via their own APIs (see :attr:`column`).
         """
         ...
 
@@ -835,10 +903,19 @@ class Column(Protocol):
             respectively return ``True`` even though ``float('nan') == float('nan')``
             isn't ``True``.
             The dtype of ``values`` must match the current column's dtype.
+            ``values`` need not be sorted, nor free of duplicates.
 
         Returns
         -------
         Column
+            Boolean column, of the same length as `self`.
+
+        Notes
+        -----
+        The algorithm is implementation defined, and may depend on the lengths
+        and dtypes of `self` and `values` - for example, a hash-based lookup,
+        a binary search over sorted `values`, or a bitmap lookup for integers
+        within a small range.
         """
         ...
 
@@ -918,6 +995,13 @@ class Column(Protocol):
         may choose to return a numpy array (for numpy prior to 2.0), with the
         understanding that consuming libraries would then use the
         ``array-api-compat`` package to convert it to a Standard-compliant array.
+
+        Where the column's dtype and storage allow it (e.g. a null-free column
+        stored in a single contiguous buffer), the returned array should be a
+        view of the column's data rather than a copy. Modifying it in-place
+        then results in undefined behaviour. As the result is array-API
+        compliant, it supports ``__dlpack__``, so it can be passed to another
+        array library's ``from_dlpack`` without copying.
         """
         ...
 
@@ -1054,6 +1138,10 @@ class Column(Protocol):
         which do not separate lazy vs eager execution may ignore this method and
         treat it as a no-op.
 
+        As for :meth:`DataFrame.persist`, implementations may cache auxiliary
+        data structures (e.g. a hash table of the column's values) for reuse by
+        subsequent operations such as :meth:`is_in`.
+
         .. note::
             This method may trigger execution. If necessary, it should be called
             at most once per dataframe, and as late as possible in the pipeline.
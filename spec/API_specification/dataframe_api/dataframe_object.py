@@ -93,6 +93,12 @@ class DataFrame(Protocol):
         Downstream operations from this function, like aggregations, return
         results for which row order is not guaranteed and is implementation
         defined.
+
+        If multiple keys are given, each group corresponds to a distinct
+        combination of values of `keys`. How groups are determined is
+        implementation defined: for example, an implementation may
+        dictionary-encode each key and combine the codes into a single
+        integer key, rather than hashing tuples of values.
         """
         ...
 
@@ -168,6 +174,18 @@ class DataFrame(Protocol):
         Returns
         -------
         DataFrame
+
+        Notes
+        -----
+        If `step` is ``None`` or positive, the selected rows keep their relative
+        order, so sortedness of `self` carries over to the result. If `step` is
+        negative, their order is reversed, and so is the direction of any sort
+        order (e.g. an ascending `self` gives a descending result).
+
+        When called on the result of :meth:`sort`, e.g.
+        ``df.sort('revenue', ascending=False).slice_rows(0, 100, None)``,
+        implementations which defer execution may compute the result with a
+        partial sort (a "top-k" selection) rather than sorting all rows.
         """
         ...
 
@@ -186,6 +204,11 @@ class DataFrame(Protocol):
         -----
         `mask`'s parent DataFrame must be `self` - else,
         the operation is unsupported and may vary across implementations.
+
+        The selected rows keep their relative order. In particular, if `self`
+        is sorted (e.g. it is the result of :meth:`sort`), then so is the
+        result, and implementations which keep track of sortedness may
+        propagate it.
         """
         ...
 
@@ -315,6 +338,12 @@ class DataFrame(Protocol):
         ------
         ValueError
             If `keys` and `ascending` are sequences of different lengths.
+
+        Notes
+        -----
+        The sorting algorithm is implementation defined - for example, an
+        implementation may radix-sort integer keys, or sort chunks of rows in
+        parallel and merge the results.
         """
         ...
 
@@ -455,6 +484,8 @@ class DataFrame(Protocol):
     def __add__(self, other: AnyScalar) -> Self:
         """Add `other` scalar to this dataframe.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Scalar
@@ -470,6 +501,8 @@ class DataFrame(Protocol):
     def __sub__(self, other: AnyScalar) -> Self:
         """Subtract `other` scalar from this dataframe.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Scalar
@@ -485,6 +518,8 @@ class DataFrame(Protocol):
     def __mul__(self, other: AnyScalar) -> Self:
         """Multiply  `other` scalar with this dataframe.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Scalar
@@ -500,6 +535,8 @@ class DataFrame(Protocol):
     def __truediv__(self, other: AnyScalar) -> Self:
         """Divide  this dataframe by `other` scalar. True division, returns floats.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Scalar
@@ -515,6 +552,8 @@ class DataFrame(Protocol):
     def __floordiv__(self, other: AnyScalar) -> Self:
         """Floor-divide (returns integers) this dataframe by `other` scalar.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Scalar
@@ -530,6 +569,8 @@ class DataFrame(Protocol):
     def __pow__(self, other: AnyScalar) -> Self:
         """Raise this dataframe to the power of `other`.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Integer dtype to the power of non-negative integer dtype is integer dtype.
         Integer dtype to the power of float dtype is float dtype.
         Float dtype to the power of integer dtype or float dtype is float dtype.
@@ -549,6 +590,8 @@ class DataFrame(Protocol):
     def __mod__(self, other: AnyScalar) -> Self:
         """Return modulus of this dataframe by `other` (`%` operator).
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Scalar
@@ -564,6 +607,8 @@ class DataFrame(Protocol):
     def __divmod__(self, other: AnyScalar) -> tuple[DataFrame, DataFrame]:
         """Return quotient and remainder of integer division. See `divmod` builtin.
 
+        Nulls propagate: the result is null wherever either operand is null.
+
         Parameters
         ----------
         other : Scalar
@@ -670,11 +715,15 @@ class DataFrame(Protocol):
         Parameters
         ----------
         correction
-            Correction to apply to the result. For example, ``0`` for sample
-            standard deviation and ``1`` for population standard deviation.
+            Correction to apply to the result. For example, ``0`` for population
+            standard deviation and ``1`` for sample standard deviation.
             See `Column.std` for a more detailed description.
         skip_nulls
             Whether to skip null values.
+
+        Notes
+        -----
+        As for `Column.std`, a numerically stable algorithm should be used.
         """
         ...
 
@@ -689,11 +738,15 @@ class DataFrame(Protocol):
         Parameters
         ----------
         correction
-            Correction to apply to the result. For example, ``0`` for sample
-            standard deviation and ``1`` for population standard deviation.
+            Correction to apply to the result. For example, ``0`` for population
+            variance and ``1`` for sample variance.
             See `Column.std` for a more detailed description.
         skip_nulls
             Whether to skip null values.
+
+        Notes
+        -----
+        As for `Column.std`, a numerically stable algorithm should be used.
         """
         ...
 
@@ -793,6 +846,9 @@ class DataFrame(Protocol):
     ) -> Self:
         """Drop rows containing null values.
 
+        A row is dropped if any of the considered columns is null in that row.
+        NaN values are not considered null.
+
         Parameters
         ----------
         column_names : list[str] | None
@@ -805,6 +861,14 @@ class DataFrame(Protocol):
             If ``column_names`` contains a column name that is not present in
             the dataframe.
 
+        Notes
+        -----
+        The result is the same as a single call to :meth:`filter`, so
+        implementations should compute one mask of rows to keep (e.g. by
+        combining the validity masks of the considered columns in one pass) and
+        apply it to all columns at once, rather than dropping nulls one column
+        at a time.
+
         """
         ...
 
@@ -840,6 +904,11 @@ class DataFrame(Protocol):
         may choose to return a numpy array (for numpy prior to 2.0), with the
         understanding that consuming libraries would then use the
         ``array-api-compat`` package to convert it to a Standard-compliant array.
+
+        If all columns share a dtype and are already stored as a single 2D block,
+        the returned array should be a view of that block, rather than being
+        assembled by copying each column. See :meth:`Column.to_array` for more on
+        views and ``__dlpack__``.
         """
 
     def join(
@@ -881,6 +950,25 @@ class DataFrame(Protocol):
         ValueError
             If, apart from `left_on` and `right_on`, there are any column names
             present in both `self` and `other`.
+        ValueError
+            If `left_on` and `right_on` have different lengths.
+
+        Notes
+        -----
+        If multiple keys are given, rows are matched when all of their
+        keys are equal, i.e. the keys are compared as a composite key.
+
+        Row order of the result is not guaranteed and is implementation
+        defined. In particular, it need not follow the row order of either
+        `self` or `other`, so implementations are free to use (for example)
+        partitioned hash joins. If a specific order is needed, call
+        :meth:`sort` on the result.
+
+        Likewise, if an implementation knows that both `self` and `other` are
+        already sorted by the join keys (e.g. because they were produced by
+        :meth:`sort`), it may use a merge join, in which case the result is
+        typically sorted by the join keys too. This is an optimisation which
+        implementations may apply, not a guarantee users may rely on.
         """
         ...
 
@@ -891,6 +979,11 @@ class DataFrame(Protocol):
         which do not separate lazy vs eager execution may ignore this method and
         treat it as a no-op.
 
+        Implementations may also cache auxiliary data structures for the
+        persisted result - such as hash tables or sort permutations over its
+        columns - so that repeated calls to :meth:`join` with the same keys, or
+        to :meth:`Column.is_in`, can reuse them instead of rebuilding them.
+
         .. note::
             This method may trigger execution. If necessary, it should be called
             at most once per dataframe, and as late as possible in the pipeline.
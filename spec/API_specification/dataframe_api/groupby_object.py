@@ -35,7 +35,12 @@ class GroupBy(Protocol):
 
     def prod(self, *, skip_nulls: bool | Scalar = True) -> DataFrame: ...
 
-    def median(self, *, skip_nulls: bool | Scalar = True) -> DataFrame: ...
+    def median(self, *, skip_nulls: bool | Scalar = True) -> DataFrame:
+        """Compute the median of each group.
+
+        The median of each group must be exact - see `Column.median`.
+        """
+        ...
 
     def mean(self, *, skip_nulls: bool | Scalar = True) -> DataFrame: ...
 
@@ -44,20 +49,52 @@ class GroupBy(Protocol):
         *,
         correction: float | Scalar = 1,
         skip_nulls: bool | Scalar = True,
-    ) -> DataFrame: ...
+    ) -> DataFrame:
+        """Compute the standard deviation of each group.
+
+        See `Column.std` for the meaning of `correction`. As for `Column.std`,
+        a numerically stable algorithm should be used.
+        """
+        ...
 
     def var(
         self,
         *,
         correction: float | Scalar = 1,
         skip_nulls: bool | Scalar = True,
-    ) -> DataFrame: ...
+    ) -> DataFrame:
+        """Compute the variance of each group.
+
+        See `Column.var` for the meaning of `correction`. As for `Column.std`,
+        a numerically stable algorithm should be used.
+        """
+        ...
 
     def size(self) -> DataFrame: ...
 
     def aggregate(self, *aggregation: Aggregation) -> DataFrame:
         """Aggregate columns according to given aggregation function.
 
+        Parameters
+        ----------
+        *aggregation : Aggregation
+            Aggregations to compute. Each one produces one column in the result.
+
+        Returns
+        -------
+        DataFrame
+            One row per group, with the grouping keys followed by the results
+            of `aggregation`, in the order in which they were given.
+
+        Notes
+        -----
+        All aggregations are computed over the same groups, so implementations
+        only need to determine group membership once, and may compute all
+        requested aggregations in a single pass over the data. Calling
+        `aggregate` once with several aggregations is therefore preferable to
+        calling it (or a `GroupBy` reduction) once per aggregation and joining
+        the results.
+
         Examples
         --------
         >>> df: DataFrame
@@ -100,7 +137,12 @@ class Aggregation(Protocol):
     def prod(cls, column: str, *, skip_nulls: bool | Scalar = True) -> Aggregation: ...
 
     @classmethod
-    def median(cls, column: str, *, skip_nulls: bool | Scalar = True) -> Aggregation: ...
+    def median(cls, column: str, *, skip_nulls: bool | Scalar = True) -> Aggregation:
+        """Compute the median of `column` within each group.
+
+        The median of each group must be exact - see `Column.median`.
+        """
+        ...
 
     @classmethod
     def mean(cls, column: str, *, skip_nulls: bool | Scalar = True) -> Aggregation: ...
@@ -112,7 +154,12 @@ class Aggregation(Protocol):
         *,
         correction: float | Scalar = 1,
         skip_nulls: bool | Scalar = True,
-    ) -> Aggregation: ...
+    ) -> Aggregation:
+        """Compute the standard deviation of `column` within each group.
+
+        See `GroupBy.std`.
+        """
+        ...
 
     @classmethod
     def var(
@@ -121,7 +168,12 @@ class Aggregation(Protocol):
         *,
         correction: float | Scalar = 1,
         skip_nulls: bool | Scalar = True,
-    ) -> Aggregation: ...
+    ) -> Aggregation:
+        """Compute the variance of `column` within each group.
+
+        See `GroupBy.var`.
+        """
+        ...
 
     @classmethod
     def size(cls) -> Aggregation: ...
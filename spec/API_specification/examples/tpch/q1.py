@@ -11,15 +11,10 @@ def query(lineitem_raw: SupportsDataFrameAPI) -> Any:
     pdx = lineitem.__dataframe_namespace__()
 
     mask = lineitem.col("l_shipdate") <= pdx.date(1998, 9, 2)
+    disc_price = lineitem.col("l_extendedprice") * (1 - lineitem.col("l_discount"))
     lineitem = lineitem.assign(
-        (lineitem.col("l_extended_price") * (1 - lineitem.col("l_discount"))).rename(
-            "l_disc_price",
-        ),
-        (
-            lineitem.col("l_extended_price")
-            * (1 - lineitem.col("l_discount"))
-            * (1 + lineitem.col("l_tax"))
-        ).rename("l_charge"),
+        disc_price.rename("l_disc_price"),
+        (disc_price * (1 + lineitem.col("l_tax"))).rename("l_charge"),
     )
     result = (
         lineitem.filter(mask)
@@ -28,7 +23,7 @@ def query(lineitem_raw: SupportsDataFrameAPI) -> Any:
             pdx.Aggregation.sum("l_quantity").rename("sum_qty"),
             pdx.Aggregation.sum("l_extendedprice").rename("sum_base_price"),
             pdx.Aggregation.sum("l_disc_price").rename("sum_disc_price"),
-            pdx.Aggregation.sum("change").rename("sum_charge"),
+            pdx.Aggregation.sum("l_charge").rename("sum_charge"),
             pdx.Aggregation.mean("l_quantity").rename("avg_qty"),
             pdx.Aggregation.mean("l_discount").rename("avg_disc"),
             pdx.Aggregation.size().rename("count_order"),
@@ -66,6 +66,10 @@ def query(
         "revenue",
     )
     result = result.assign(new_column)
-    result = result.group_by("n_name").aggregate(pdx.Aggregation.sum("revenue"))
+    result = (
+        result.group_by("n_name")
+        .aggregate(pdx.Aggregation.sum("revenue"))
+        .sort("revenue", ascending=False)
+    )
 
     return result.dataframe